@@ -3,6 +3,8 @@
 from __future__ import annotations  # remove this from python 3.11
 
 import random
+from itertools import chain
+from operator import gt, lt
 from typing import Literal
 
 from .utils import merge_lists
@@ -15,16 +17,23 @@ class Memory:
     a more suitable python object will be used to represent the graph structure of the
     memories.
 
+    The head, relation, and tail of every memory are indexed, so they have to be
+    hashable (e.g., strings). `entries` should only be changed through the methods of
+    this class (e.g., `add`, `forget`, `forget_all`), otherwise the index goes stale.
+
     Attributes:
         type: episodic, semantic, short, or working
         entries: list of memories
         capacity: memory capacity
         _frozen: whether the memory system is frozen or not
+        _index: head, relation, and tail lookup tables. Each one maps a value to the
+            entries that have it at that position, keyed by `id`, in insertion order.
+        _counts: how many times each entry (by `id`) is held in `entries`
 
 
     """
 
-    def __init__(self, capacity: int, memories: list[list] = []) -> None:
+    def __init__(self, capacity: int, memories: list[list] | None = None) -> None:
         """
 
         Args:
@@ -34,6 +43,8 @@ class Memory:
 
         """
         self.entries = []
+        self._index = ({}, {}, {})
+        self._counts = {}
         self.capacity = capacity
         assert self.capacity >= 0
         self._frozen = False
@@ -54,7 +65,30 @@ class Memory:
 
     def __add__(self, other):
         entries = self.entries + other.entries
-        return Memory(self.capacity + other.capacity, entries)
+        return Memory._from_entries(self.capacity + other.capacity, entries)
+
+    @staticmethod
+    def _from_entries(capacity: int, entries: list[list]) -> Memory:
+        """Make a memory system out of entries that are known to fit.
+
+        Unlike passing `memories` to the constructor, this does not check and add the
+        memories one by one. The given list is taken over as is.
+
+        Args:
+            capacity: memory capacity
+            entries: memories to hold. There should be at most `capacity` of them.
+
+        Returns:
+            memory: Memory
+
+        """
+        assert len(entries) <= capacity
+        memory = Memory(capacity)
+        memory.entries = entries
+        for mem in entries:
+            memory._index_add(mem)
+
+        return memory
 
     def can_be_added(self, mem) -> tuple[bool, str | None]:
         """Check if a memory can be added to the system or not.
@@ -70,6 +104,11 @@ class Memory:
         if self._frozen:
             return False, "The memory system is frozen!"
 
+        try:
+            hash((mem[0], mem[1], mem[2]))
+        except TypeError:
+            return False, "The head, relation, and tail should be hashable!"
+
         return True, ""
 
     def add(self, mem: list) -> None:
@@ -84,7 +123,17 @@ class Memory:
         check, error_msg = self.can_be_added(mem)
         if not check:
             raise ValueError(error_msg)
+        self._append(mem)
+
+    def _append(self, mem: list) -> None:
+        """Append a memory that has already been checked with `can_be_added`.
+
+        Args:
+           mem: A memory as a quadraple: [head, relation, tail, num]
+
+        """
         self.entries.append(mem)
+        self._index_add(mem)
 
         if self.size > self.capacity:
             raise ValueError(f"Something went wrong. {self.size} > {self.capacity}.")
@@ -109,7 +158,7 @@ class Memory:
         if self._frozen:
             return False, "The memory system is frozen!"
 
-        if mem not in self.entries:
+        if not self.has_memory(mem):
             return False, f"{mem} is not in the memory system!"
 
         return True, None
@@ -122,7 +171,9 @@ class Memory:
                 either a list of an int.
 
         """
-        self.entries.remove(mem)
+        # Same scan as `list.remove`, but it also tells which entry object went away
+        entry = self.entries.pop(self.entries.index(mem))
+        self._index_remove(entry)
 
     def forget_all(self) -> None:
         """Forget everything in the memory system!"""
@@ -136,6 +187,54 @@ class Memory:
 
         else:
             self.entries = []
+            self._index = ({}, {}, {})
+            self._counts = {}
+
+    def _find_same_triple(self, mem: list) -> list | None:
+        """Find the entry that has the same head, relation, and tail as `mem`.
+
+        Args:
+            mem: A memory as a quadraple: [head, relation, tail, qualifiers]
+
+        Returns:
+            entry: the first matching entry, or None if there is none
+
+        """
+        for entry in self._index[0].get(mem[0], {}).values():
+            if entry[1] == mem[1] and entry[2] == mem[2]:
+                return entry
+
+        return None
+
+    def _index_add(self, mem: list) -> None:
+        """Register a memory in the head, relation, and tail lookup tables."""
+        key = id(mem)
+        count = self._counts.get(key, 0)
+        if count == 0:
+            for position, index in enumerate(self._index):
+                index.setdefault(mem[position], {})[key] = mem
+        self._counts[key] = count + 1
+
+    def _index_remove(self, mem: list) -> None:
+        """Unregister one occurrence of a memory from the lookup tables.
+
+        The memory is matched by identity, so that the very entry that was removed
+        from `self.entries` is the one dropped here. It only leaves the tables once
+        its last occurrence is gone.
+
+        """
+        key = id(mem)
+        count = self._counts[key] - 1
+        if count > 0:
+            self._counts[key] = count
+            return
+
+        del self._counts[key]
+        for position, index in enumerate(self._index):
+            bucket = index[mem[position]]
+            del bucket[key]
+            if not bucket:
+                del index[mem[position]]
 
     def has_memory(self, mem: list) -> bool:
         """Check if a memory is in the memory system.
@@ -147,7 +246,7 @@ class Memory:
             True or False
 
         """
-        return mem in self.entries
+        return mem in self._index[0].get(mem[0], {}).values()
 
     @property
     def is_empty(self) -> bool:
@@ -209,6 +308,9 @@ class Memory:
     def to_list(self) -> list[list]:
         """Return the memories as a list of lists.
 
+        This is the list the memory system itself holds, not a copy. Treat it as
+        read-only; use `add` and `forget` to change the memories.
+
         Returns:
             a list of lists
 
@@ -228,16 +330,39 @@ class Memory:
 
         """
         assert len(query) == 4
+
+        # The query is the same for every entry, so unpack it and build the qualifier
+        # key set only once.
+        head, relation, tail, qualifiers = query
+        if qualifiers != "?":
+            qualifiers = set(qualifiers)
+
         mems_found = []
 
-        for mem in self.to_list():
-            if (query[0] == "?") or (query[0] == mem[0]):
-                if (query[1] == "?") or (query[1] == mem[1]):
-                    if (query[2] == "?") or (query[2] == mem[2]):
-                        if (query[3] == "?") or (set(query[3]).issubset(set(mem[3]))):
+        # Only scan the entries that match the most selective given head, relation, or
+        # tail. If any of them matches nothing, neither does the query.
+        candidates = self.entries
+        for position, value in enumerate((head, relation, tail)):
+            if value != "?":
+                bucket = self._index[position].get(value)
+                if bucket is None:
+                    return Memory(0)
+                if len(bucket) < len(candidates):
+                    candidates = bucket.values()
+
+        # A bucket holds each entry once, so scan all the entries when one of them is
+        # held more than once (e.g., after `m + m`).
+        if len(self._counts) < len(self.entries):
+            candidates = self.entries
+
+        for mem in candidates:
+            if (head == "?") or (head == mem[0]):
+                if (relation == "?") or (relation == mem[1]):
+                    if (tail == "?") or (tail == mem[2]):
+                        if (qualifiers == "?") or (qualifiers.issubset(mem[3])):
                             mems_found.append(mem)
 
-        return Memory(len(mems_found), mems_found)
+        return Memory._from_entries(len(mems_found), mems_found)
 
     def retrieve_random_memory(self) -> list:
         """Retrieve a random memory from the memory system.
@@ -275,35 +400,46 @@ class Memory:
                     return element[qualifier]
             return None
 
-        # Initialize variables to track the memory with the desired qualifier value
+        # Resolve the selection methods once. An invalid one only raises when there is
+        # a value to select with, so an empty memory still returns None.
         if select_by == "min":
-            desired_value = float("inf")
+            is_better = lt
         elif select_by == "max":
-            desired_value = float("-inf")
+            is_better = gt
+        else:
+            is_better = None
+
+        if list_select_by == "min":
+            reduce_list = min
+        elif list_select_by == "max":
+            reduce_list = max
+        else:
+            reduce_list = None
+
+        desired_value = None
         desired_memory = None
 
-        # Comparison function to update the desired memory and value
-        def compare_and_update(value, memory):
-            nonlocal desired_value, desired_memory
-            if (select_by == "min" and value < desired_value) or (
-                select_by == "max" and value > desired_value
-            ):
+        # Iterate over each memory and update the desired memory based on the qualifier
+        # type. Strict comparison keeps the first memory on ties.
+        for memory in self.to_list():
+            value = get_qualifier_value(memory)
+            if value is None:
+                continue
+
+            if qualifier_object_type == "list":
+                if reduce_list is None:
+                    raise ValueError(
+                        "Invalid list_select_by. Please choose from 'min', 'max'."
+                    )
+                value = reduce_list(value)
+
+            if is_better is None:
+                raise ValueError("Invalid select_by. Please choose from 'min', 'max'.")
+
+            if desired_memory is None or is_better(value, desired_value):
                 desired_value = value
                 desired_memory = memory
 
-        # Iterate over each memory and update the desired memory based on the qualifier type
-        for memory in self.to_list():
-            qualifier_value = get_qualifier_value(memory)
-            if qualifier_value is not None:
-                if qualifier_object_type == "list":
-                    if list_select_by == "max":
-                        value = max(qualifier_value)
-                    elif list_select_by == "min":
-                        value = min(qualifier_value)
-                else:  # qualifier_object_type == "int"
-                    value = qualifier_value
-                compare_and_update(value, memory)
-
         return desired_memory
 
 
@@ -331,9 +467,8 @@ class ShortMemory(Memory):
             return False, "The memory should have current_time!"
 
         if self.is_full:
-            for entry in self.entries:
-                if entry[:-1] == mem[:-1]:
-                    return True, None
+            if self._find_same_triple(mem) is not None:
+                return True, None
 
             return False, "The memory system is full!"
 
@@ -420,9 +555,8 @@ class LongMemory(Memory):
             return False, "The memory should have timestamp or strength!"
 
         if self.is_full:
-            for entry in self.entries:
-                if entry[:-1] == mem[:-1]:
-                    return True, None
+            if self._find_same_triple(mem) is not None:
+                return True, None
 
             return False, "The memory system is full!"
 
@@ -435,35 +569,36 @@ class LongMemory(Memory):
         Args:
             mem: A memory as a quadraple: [head, relation, tail, qualifiers]
         """
-        assert self.can_be_added(mem)[0]
-
-        added = False
+        check, error_msg = self.can_be_added(mem)
+        if not check:
+            raise ValueError(error_msg)
 
-        for entry in self.entries:
-            if entry[:-1] == mem[:-1]:
-                # Merge 'timestamp' values if present in both dictionaries
-                if "timestamp" in entry[-1] and "timestamp" in mem[-1]:
-                    entry[-1]["timestamp"] = sorted(
-                        entry[-1]["timestamp"] + mem[-1]["timestamp"]
-                    )
-                elif "timestamp" in entry[-1]:
-                    pass
-                elif "timestamp" in mem[-1]:
-                    entry[-1]["timestamp"] = mem[-1]["timestamp"]
-
-                # Sum 'strength' values if present in both dictionaries
-                if "strength" in entry[-1] and "strength" in mem[-1]:
-                    entry[-1]["strength"] = entry[-1]["strength"] + mem[-1]["strength"]
-                elif "strength" in entry[-1]:
-                    pass
-                elif "strength" in mem[-1]:
-                    entry[-1]["strength"] = mem[-1]["strength"]
-
-                added = True
-                break
+        entry = self._find_same_triple(mem)
+
+        if entry is not None:
+            entry_qualifiers = entry[-1]
+            mem_qualifiers = mem[-1]
+
+            # Merge 'timestamp' values if present in both dictionaries
+            if "timestamp" in entry_qualifiers and "timestamp" in mem_qualifiers:
+                entry_qualifiers["timestamp"] = sorted(
+                    entry_qualifiers["timestamp"] + mem_qualifiers["timestamp"]
+                )
+            elif "timestamp" in entry_qualifiers:
+                pass
+            elif "timestamp" in mem_qualifiers:
+                entry_qualifiers["timestamp"] = mem_qualifiers["timestamp"]
+
+            # Sum 'strength' values if present in both dictionaries
+            if "strength" in entry_qualifiers and "strength" in mem_qualifiers:
+                entry_qualifiers["strength"] += mem_qualifiers["strength"]
+            elif "strength" in entry_qualifiers:
+                pass
+            elif "strength" in mem_qualifiers:
+                entry_qualifiers["strength"] = mem_qualifiers["strength"]
 
-        if not added:
-            super().add(mem)
+        else:
+            self._append(mem)
 
     def forget_by_selection(
         self, selection: Literal["oldest", "latest", "weakest", "strongest"]
@@ -604,11 +739,8 @@ class MemorySystems:
                 "Not implemented yet. Please set working_num_hops to None."
             )
 
-        working = []
-        working += self.short.entries
-        working += self.long.entries
-        working = merge_lists(working)
+        working = merge_lists(chain(self.short.entries, self.long.entries))
 
-        working = Memory(len(working), working)
+        working = Memory._from_entries(len(working), working)
 
         return working
@@ -5,8 +5,9 @@ import json
 import os
 import pickle
 import random
-from collections import defaultdict
 from copy import deepcopy
+from operator import itemgetter
+from typing import Iterable
 
 import numpy as np
 import torch
@@ -116,7 +117,7 @@ def load_questions(path: str) -> dict:
 
 def argmax(iterable):
     """argmax"""
-    return max(enumerate(iterable), key=lambda x: x[1])[0]
+    return max(enumerate(iterable), key=itemgetter(1))[0]
 
 
 def get_duplicate_dicts(search: dict, target: list) -> list:
@@ -171,36 +172,37 @@ def is_running_notebook() -> bool:
         return False  # Probably standard Python interpreter
 
 
-def merge_lists(lists: list[list]) -> list:
+def merge_lists(lists: Iterable[list]) -> list:
     """Merge a list of lists of lists into a single list of lists.
 
     Deepcopy is used to avoid modifying the original lists / dicts.
 
     Args:
-        lists: A list of lists of lists. Each sublist should have the format
-            [key, value], where key is a tuple of three elements and value is a
-            dictionary.
+        lists: A list (or any iterable) of lists of lists. Each sublist should have
+            the format [key, value], where key is a tuple of three elements and value
+            is a dictionary.
 
     Returns:
         merged_list: A list of lists with the format [key, value], where key is
             a tuple of three elements and value is a dictionary.
     """
-    merged_dict = defaultdict(dict)
+    merged_dict = {}
 
     for sublist in lists:
         key = tuple(sublist[:3])
-        if key in merged_dict:
-            # Merge dictionaries
+        merged = merged_dict.get(key)
+        if merged is not None:
+            # Merge dictionaries in place
             for k, v in sublist[3].items():
-                if k in merged_dict[key]:
+                if k in merged:
                     if isinstance(v, list):
                         # Merge lists and remove duplicates
-                        merged_dict[key][k] = list(set(merged_dict[key][k] + v))
+                        merged[k] = list(set(merged[k]).union(v))
                     else:
                         # Handle non-list values
-                        merged_dict[key][k] = max(merged_dict[key][k], v)
+                        merged[k] = max(merged[k], v)
                 else:
-                    merged_dict[key][k] = deepcopy(v)
+                    merged[k] = deepcopy(v)
         else:
             merged_dict[key] = deepcopy(sublist[3])
 
@@ -65,6 +65,60 @@ class TestMemory(unittest.TestCase):
             ["Alice", "loves", "Charlie", {"type": "episodic"}] in result.to_list()
         )
 
+    def test_query_after_forget(self):
+        self.memory.add(["Alice", "likes", "Bob", {"type": "episodic"}])
+        self.memory.add(["Charlie", "likes", "Bob", {"type": "semantic"}])
+        self.memory.add(["Alice", "loves", "Charlie", {"type": "episodic"}])
+        self.memory.forget(["Alice", "likes", "Bob", {"type": "episodic"}])
+        self.assertEqual(
+            self.memory.query(["?", "?", "Bob", "?"]).to_list(),
+            [["Charlie", "likes", "Bob", {"type": "semantic"}]],
+        )
+        self.assertEqual(len(self.memory.query(["Alice", "likes", "?", "?"])), 0)
+        self.assertEqual(len(self.memory.query(["Nobody", "likes", "Bob", "?"])), 0)
+        self.assertEqual(
+            self.memory.query(["?", "likes", "Bob", {"type": "semantic"}]).to_list(),
+            [["Charlie", "likes", "Bob", {"type": "semantic"}]],
+        )
+        self.memory.forget_all()
+        self.assertEqual(len(self.memory.query(["?", "loves", "?", "?"])), 0)
+
+    def test_forget_after_adding_to_itself(self):
+        mem = ["Alice", "likes", "Bob", {"type": "episodic"}]
+        self.memory.add(mem)
+        self.memory.add(["Charlie", "likes", "Bob", {"type": "semantic"}])
+        doubled = self.memory + self.memory
+        self.assertEqual(len(doubled.query(["Alice", "?", "?", "?"])), 2)
+
+        doubled.forget(mem)
+        self.assertEqual(len(doubled), 3)
+        self.assertTrue(doubled.has_memory(mem))
+        self.assertEqual(len(doubled.query(["Alice", "?", "?", "?"])), 1)
+        self.assertEqual(len(doubled.query(["?", "likes", "Bob", "?"])), 3)
+
+        doubled.forget(mem)
+        self.assertFalse(doubled.has_memory(mem))
+        self.assertEqual(len(doubled.query(["Alice", "?", "?", "?"])), 0)
+        self.assertEqual(len(doubled.query(["?", "likes", "Bob", "?"])), 2)
+        self.assertEqual(len(self.memory.query(["Alice", "?", "?", "?"])), 1)
+
+    def test_add_unhashable_memory(self):
+        mem = ["Alice", "likes", ["Bob"], {"type": "episodic"}]
+        self.assertFalse(self.memory.can_be_added(mem)[0])
+        with self.assertRaises(ValueError):
+            self.memory.add(mem)
+        self.assertEqual(len(self.memory), 0)
+        self.assertEqual(len(self.memory.query(["Alice", "?", "?", "?"])), 0)
+
+    def test_add_memory_systems(self):
+        self.memory.add(["Alice", "likes", "Bob", {"type": "episodic"}])
+        other = Memory(capacity=3, memories=[["Bob", "likes", "Alice", {}]])
+        combined = self.memory + other
+        self.assertEqual(combined.capacity, 8)
+        self.assertEqual(len(combined), 2)
+        self.assertTrue(combined.has_memory(["Bob", "likes", "Alice", {}]))
+        self.assertEqual(len(combined.query(["?", "likes", "Alice", "?"])), 1)
+
     def test_retrieve_random_memory(self):
         self.memory.add(["Alice", "likes", "Bob", {"type": "episodic"}])
         random_memory = self.memory.retrieve_random_memory()
@@ -117,6 +171,104 @@ class TestLongMemory(unittest.TestCase):
             )
         )
 
+    def test_add_merges_timestamps(self):
+        timestamps = [1, 5]
+        self.long_memory.add(["Alice", "likes", "Bob", {"timestamp": timestamps}])
+        self.long_memory.add(["Alice", "likes", "Bob", {"timestamp": [3]}])
+        self.long_memory.add(["Alice", "likes", "Bob", {"strength": 2}])
+        self.assertEqual(len(self.long_memory), 1)
+        self.assertEqual(
+            self.long_memory.to_list()[0],
+            ["Alice", "likes", "Bob", {"timestamp": [1, 3, 5], "strength": 2}],
+        )
+        self.assertEqual(timestamps, [1, 5])
+
+    def test_add_when_full(self):
+        long_memory = LongMemory(capacity=1)
+        long_memory.add(["Alice", "likes", "Bob", {"timestamp": [1]}])
+        self.assertTrue(long_memory.is_full)
+        self.assertTrue(
+            long_memory.can_be_added(["Alice", "likes", "Bob", {"timestamp": [2]}])[0]
+        )
+        self.assertFalse(
+            long_memory.can_be_added(["Bob", "likes", "Alice", {"timestamp": [2]}])[0]
+        )
+        long_memory.add(["Alice", "likes", "Bob", {"timestamp": [2]}])
+        self.assertEqual(
+            long_memory.to_list(), [["Alice", "likes", "Bob", {"timestamp": [1, 2]}]]
+        )
+
+    def test_forget_by_selection(self):
+        self.long_memory.add(["Alice", "likes", "Bob", {"timestamp": [1, 4]}])
+        self.long_memory.add(["Bob", "likes", "Alice", {"timestamp": [2, 3]}])
+        self.long_memory.add(["desk", "atlocation", "office", {"strength": 3}])
+        self.long_memory.add(["chair", "atlocation", "office", {"strength": 1}])
+        self.long_memory.add(["lamp", "atlocation", "office", {"strength": 1}])
+
+        self.long_memory.forget_by_selection("oldest")
+        self.assertFalse(
+            self.long_memory.has_memory(
+                ["Bob", "likes", "Alice", {"timestamp": [2, 3]}]
+            )
+        )
+        self.long_memory.forget_by_selection("latest")
+        self.assertEqual(self.long_memory.count_memories(), (0, 3))
+        with self.assertRaises(ValueError):
+            self.long_memory.forget_by_selection("oldest")
+
+        self.long_memory.forget_by_selection("weakest")
+        self.assertFalse(
+            self.long_memory.has_memory(
+                ["chair", "atlocation", "office", {"strength": 1}]
+            )
+        )
+        self.long_memory.forget_by_selection("strongest")
+        self.assertEqual(
+            self.long_memory.to_list(),
+            [["lamp", "atlocation", "office", {"strength": 1}]],
+        )
+
+    def test_retrieve_memory_by_qualifier_validation(self):
+        self.assertIsNone(
+            self.long_memory.retrieve_memory_by_qualifier("timestamp", "list", "min")
+        )
+        self.assertIsNone(
+            self.long_memory.retrieve_memory_by_qualifier("strength", "int", "oldest")
+        )
+
+        self.long_memory.add(["Alice", "likes", "Bob", {"timestamp": [1, 4]}])
+        self.long_memory.add(["desk", "atlocation", "office", {"strength": 3}])
+        with self.assertRaises(ValueError):
+            self.long_memory.retrieve_memory_by_qualifier("timestamp", "list", "min")
+        with self.assertRaises(ValueError):
+            self.long_memory.retrieve_memory_by_qualifier("strength", "int", "oldest")
+        self.assertEqual(
+            self.long_memory.retrieve_memory_by_qualifier(
+                "timestamp", "list", "min", "max"
+            ),
+            ["Alice", "likes", "Bob", {"timestamp": [1, 4]}],
+        )
+
+    def test_query_derived_memory_after_merge(self):
+        self.long_memory.add(["Alice", "likes", "Bob", {"timestamp": [1]}])
+        combined = self.long_memory + ShortMemory(capacity=1)
+        view = self.long_memory.query(["Alice", "?", "?", "?"])
+        self.assertEqual(len(combined.query(["?", "?", "?", ["strength"]])), 0)
+        self.assertEqual(len(view.query(["?", "?", "?", ["strength"]])), 0)
+
+        # The derived memories share the entry that the merge updates in place.
+        self.long_memory.add(["Alice", "likes", "Bob", {"strength": 1}])
+        self.assertEqual(len(combined.query(["?", "?", "?", ["strength"]])), 1)
+        self.assertEqual(len(view.query(["?", "?", "?", ["strength"]])), 1)
+
+    def test_add_invalid_memory(self):
+        with self.assertRaises(ValueError):
+            self.long_memory.add(["Alice", "likes", "Bob", {"current_time": 1}])
+        self.long_memory.freeze()
+        with self.assertRaises(ValueError):
+            self.long_memory.add(["Alice", "likes", "Bob", {"timestamp": [1]}])
+        self.assertEqual(len(self.long_memory), 0)
+
     def test_pretrain_semantic(self):
         semantic_knowledge = [
             ["desk", "atlocation", "office"],